@@ -1,29 +1,68 @@
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends, Request, Response, status
+from fastapi import FastAPI, Form, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse
 from typing import Optional
+from contextlib import asynccontextmanager
 import uvicorn
-import secrets
+import base64
 import os
 
-from models import ScreeningResponse, MatchScoreBreakdown
+from routes import router
 from resume_parser import ResumeParser
 from matching_engine import MatchingEngine
 from authlib.integrations.starlette_client import OAuth
 from starlette.middleware.sessions import SessionMiddleware
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared screening components and the parsing worker processes"""
+    # One parser and engine per app, so every request shares their models and caches
+    app.state.resume_parser = ResumeParser()
+    app.state.matching_engine = MatchingEngine()
+    
+    # PARSE_WORKERS=0 keeps parsing on threads in this process
+    parse_workers = int(os.getenv("PARSE_WORKERS", os.cpu_count() or 1))
+    if parse_workers > 0:
+        app.state.resume_parser.start_process_pool(parse_workers)
+    yield
+    app.state.resume_parser.shutdown_process_pool()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Resume Screening API",
     description="API for screening resumes against job descriptions using NLP and machine learning",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Pre-buffered entropy for mapping IDs: one getrandom call per 128 IDs
+MAPPING_ID_BYTES = 32
+ENTROPY_POOL_SIZE = 4096
+_entropy_pool = b""
+_entropy_offset = 0
+
 def generate_mapping_id():
     print("Generating a 32 byte mapping id")
     """Generate a secure mapping ID."""
-    return secrets.token_urlsafe(32)
+    global _entropy_pool, _entropy_offset
+    if _entropy_offset + MAPPING_ID_BYTES > len(_entropy_pool):
+        _entropy_pool = os.urandom(ENTROPY_POOL_SIZE)
+        _entropy_offset = 0
+    token_bytes = _entropy_pool[_entropy_offset:_entropy_offset + MAPPING_ID_BYTES]
+    _entropy_offset += MAPPING_ID_BYTES
+    # Same format as secrets.token_urlsafe(32)
+    return base64.urlsafe_b64encode(token_bytes).rstrip(b"=").decode("ascii")
+
+def _reset_entropy_pool():
+    """Drop buffered entropy in a forked child so it never repeats the parent's upcoming IDs"""
+    global _entropy_pool, _entropy_offset
+    _entropy_pool = b""
+    _entropy_offset = 0
+
+os.register_at_fork(after_in_child=_reset_entropy_pool)
 
 app.add_middleware(
     SessionMiddleware,
@@ -39,10 +78,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize components
-resume_parser = ResumeParser()
-matching_engine = MatchingEngine()
-
+# Screening routes
+app.include_router(router)
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -77,15 +114,6 @@ oauth.register(
     redirect_uri=GOOGLE_REDIRECT_URI
 )
 
-def get_resume_parser():
-    """Dependency injection for resume parser"""
-    return resume_parser
-
-def get_matching_engine():
-    """Dependency injection for matching engine"""
-    return matching_engine
-
-
 @app.get('/auth/google')
 async def auth_google(request: Request):
     redirect_uri = GOOGLE_REDIRECT_URI
@@ -165,7 +193,7 @@ async def user(request: Request):
         print("User End point : Session seems active")
         keys_to_filter = ['email', 'email_verified', 'family_name', 'given_name', 'hd', 'name', 'picture', 'sub']
         user_info_ui = {key: user_info.get(key) for key in keys_to_filter if key in user_info}
-        return JSONResponse(user_info_ui)
+        return ORJSONResponse(user_info_ui)
     
     print("User End point : Session seems inactive, redirecting to the Signin page")
     response = RedirectResponse(
@@ -196,87 +224,6 @@ async def logout(request: Request):
     )
     return response
 
-@app.get("/")
-async def root():
-    """Root endpoint with API information"""
-    return {
-        "message": "Resume Screening API",
-        "version": "1.0.0",
-        "endpoints": {
-            "screen_resume": "/screen_resume",
-            "health": "/health"
-        }
-    }
-
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "Resume Screening API"}
-
-@app.post("/screen_resume", response_model=ScreeningResponse)
-async def screen_resume(
-    resume_file: UploadFile = File(..., description="Resume file (PDF, DOCX, or TXT)"),
-    jd_file: UploadFile = File(..., description="Job description file (PDF, DOCX, or TXT)"),
-    # jd_text: Optional[str] = Form(None, description="Job description as text"),
-    parser: ResumeParser = Depends(get_resume_parser),
-    engine: MatchingEngine = Depends(get_matching_engine)
-):
-    """
-    Screen a resume against a job description and return match scores
-    
-    Args:
-        resume_file: Resume file upload (required)
-        jd_file: Job description file upload (optional if jd_text provided)
-        jd_text: Job description as text (optional if jd_file provided)
-        
-    Returns:
-        ScreeningResponse with overall match percentage and detailed breakdown
-    """
-    try:
-        # Validate inputs
-        if not jd_file:
-        # and not jd_text:
-            raise HTTPException(
-                status_code=400, 
-                detail="jd_file must be provided"
-            )
-        
-        # Parse resume
-        resume_data = parser.parse_resume(resume_file)
-        
-        # Parse job description
-        jd_data = parser.parse_job_description(file=jd_file)
-        
-        # Calculate match scores
-        match_result = engine.calculate_match_score(resume_data, jd_data)
-        
-        # Determine message based on score
-        overall_score = match_result['overall_score']
-        if overall_score >= 80:
-            message = "Excellent match! This candidate meets most of the job requirements."
-        elif overall_score >= 60:
-            message = "Good match! This candidate has several relevant qualifications."
-        elif overall_score >= 40:
-            message = "Fair match! This candidate has some relevant experience but may need additional training."
-        elif overall_score >= 20:
-            message = "Limited match! This candidate has minimal relevant qualifications."
-        else:
-            message = "Poor match! This candidate does not meet most of the job requirements."
-        
-        return ScreeningResponse(
-            overall_match_percentage=overall_score,
-            breakdown=match_result['breakdown'],
-            message=message
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, 
-            detail=f"An error occurred while processing the request: {str(e)}"
-        )
-
 if __name__ == "__main__":
     uvicorn.run(
         "main:app", 
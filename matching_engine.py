@@ -1,9 +1,113 @@
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+import re
+import threading
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from models import ResumeData, JobDescriptionData, MatchScoreBreakdown
 
+# Try to import sentence-transformers with fallback to TF-IDF
+try:
+    from sentence_transformers import SentenceTransformer
+    HAS_SBERT = True
+except ImportError:
+    HAS_SBERT = False
+
+# Try to import numba with fallback to numpy
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Try to import RE2 for linear-time DFA tokenization with fallback to re
+try:
+    import re2 as _token_regex
+    HAS_RE2 = True
+except ImportError:
+    import re as _token_regex
+    HAS_RE2 = False
+
+_TOKEN_RE = _token_regex.compile(r"[a-zA-Z][a-zA-Z0-9+#.\-]{1,}")
+
+SBERT_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Bump whenever a change to the scoring code alters results, so persisted scores from older
+# code are not reused; parser output changes bump resume_parser.PARSER_VERSION instead
+SCORING_VERSION = 2
+EMBEDDING_CACHE_SIZE = 1024
+
+# Experience score per 20% bucket of resume/required years; the last bucket meets the requirement
+_EXPERIENCE_LUT = np.array([0.1, 0.3, 0.5, 0.7, 0.9, 1.0])
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _overlap_ratio(req_ids, resume_ids):
+        """Fraction of requirement token ids found in the resume, via a sorted two-pointer scan"""
+        n_req = req_ids.shape[0]
+        n_resume = resume_ids.shape[0]
+        if n_req == 0:
+            return 0.0
+        i = 0
+        j = 0
+        common = 0
+        while i < n_req and j < n_resume:
+            if req_ids[i] == resume_ids[j]:
+                common += 1
+                i += 1
+                j += 1
+            elif req_ids[i] < resume_ids[j]:
+                i += 1
+            else:
+                j += 1
+        return common / n_req
+else:
+    def _overlap_ratio(req_ids: np.ndarray, resume_ids: np.ndarray) -> float:
+        """Fraction of requirement token ids found in the resume"""
+        if req_ids.shape[0] == 0:
+            return 0.0
+        common = np.intersect1d(req_ids, resume_ids, assume_unique=True).shape[0]
+        return common / req_ids.shape[0]
+
+
+@lru_cache(maxsize=256)
+def _fit_jd(jd_hash: str, jd_text: str) -> Tuple[TfidfVectorizer, np.ndarray]:
+    """
+    Fit a TF-IDF vectorizer on a job description and cache it by content hash
+
+    The same JD is usually screened against many resumes, so the vocabulary
+    and JD vector are built once and only the resume is transformed per call.
+    Vectors are L2-normalized, so cosine similarity reduces to a dot product.
+
+    Args:
+        jd_hash: SHA-1 hex digest of the job description text
+        jd_text: Full job description text
+
+    Returns:
+        Tuple of (fitted vectorizer, dense L2-normalized JD vector)
+    """
+    vectorizer = TfidfVectorizer(
+        max_features=1000,
+        stop_words='english',
+        ngram_range=(1, 2),
+        min_df=1,
+        max_df=1.0,
+        dtype=np.float32,
+        sublinear_tf=True,
+        norm='l2'
+    )
+    jd_vec = vectorizer.fit_transform([jd_text]).toarray().ravel()
+    return vectorizer, jd_vec
+
+
+@lru_cache(maxsize=1024)
+def _normalize_skills(skills: Tuple[str, ...]) -> frozenset:
+    """Lowercase and strip a tuple of skills into a cached frozenset"""
+    return frozenset(skill.lower().strip() for skill in skills)
+
 
 class MatchingEngine:
     """Engine for calculating match scores between resumes and job descriptions"""
@@ -15,6 +119,65 @@ class MatchingEngine:
             'education': 0.2,
             'semantic': 0.1
         }
+        
+        # Weighted sum specialized on the weights above; works on scalars and arrays
+        skills_weight = self.weights['skills']
+        experience_weight = self.weights['experience']
+        education_weight = self.weights['education']
+        semantic_weight = self.weights['semantic']
+        
+        def weighted(skills, experience, education, semantic):
+            return (
+                skills * skills_weight +
+                experience * experience_weight +
+                education * education_weight +
+                semantic * semantic_weight
+            )
+        
+        self._weighted = weighted
+        
+        # Common education keywords
+        education_keywords = {
+            'bachelor': ['bachelor', 'b.s', 'b.sc', 'b.a', 'bs', 'bsc', 'ba', 'undergraduate'],
+            'master': ['master', 'm.s', 'm.sc', 'm.a', 'ms', 'msc', 'ma', 'mba', 'graduate'],
+            'phd': ['phd', 'ph.d', 'doctorate', 'doctoral'],
+            'associate': ['associate', 'associates'],
+            'diploma': ['diploma', 'certificate', 'certification'],
+            'degree': ['degree']
+        }
+        self._education_keywords = {
+            edu_type: frozenset(keyword.lower() for keyword in keywords)
+            for edu_type, keywords in education_keywords.items()
+        }
+        # One alternation per category so each text is scanned once in C;
+        # whole words only (plurals allowed), so 'ms' no longer matches inside 'programs'
+        self._edu_patterns = {
+            edu_type: re.compile(
+                r'\b(?:' + '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)) + r')s?\b'
+            )
+            for edu_type, keywords in self._education_keywords.items()
+        }
+        
+        # Sentence-BERT encoder with an LRU cache of normalized embeddings
+        self._sbert = None
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embedding_lock = threading.Lock()
+        self._initialize_sbert()
+    
+    @property
+    def scorer_name(self) -> str:
+        """Which semantic scorer is active: 'sbert' or 'tfidf'"""
+        return 'sbert' if self._sbert is not None else 'tfidf'
+
+    def _initialize_sbert(self):
+        """Initialize the Sentence-BERT encoder, falling back to TF-IDF if unavailable"""
+        if not HAS_SBERT:
+            return
+        try:
+            self._sbert = SentenceTransformer(SBERT_MODEL_NAME)
+        except Exception:
+            # Model could not be loaded (e.g. offline), keep the TF-IDF path
+            self._sbert = None
     
     def calculate_match_score(self, resume_data: ResumeData, jd_data: JobDescriptionData) -> Dict:
         """
@@ -44,12 +207,7 @@ class MatchingEngine:
             )
             
             # Calculate weighted overall score
-            overall_score = (
-                skills_score * self.weights['skills'] +
-                experience_score * self.weights['experience'] +
-                education_score * self.weights['education'] +
-                semantic_score * self.weights['semantic']
-            )
+            overall_score = self._weighted(skills_score, experience_score, education_score, semantic_score)
             
             breakdown = MatchScoreBreakdown(
                 skills_score=round(skills_score * 100, 2),
@@ -73,9 +231,79 @@ class MatchingEngine:
             )
             return {
                 'overall_score': 0.0,
-                'breakdown': breakdown
+                'breakdown': breakdown,
+                # Marks the placeholder so callers don't persist it as a real score
+                'fallback': True
             }
     
+    def calculate_match_scores_batch(self, resume_data_list: List[ResumeData], jd_data: JobDescriptionData) -> List[Dict]:
+        """
+        Calculate match scores for many resumes against one job description
+        
+        Skills, experience and semantic scores are computed for the whole batch
+        at once; the JD is vectorized or encoded a single time.
+        
+        Args:
+            resume_data_list: Parsed resume data, one per resume
+            jd_data: Parsed job description data
+            
+        Returns:
+            List of dictionaries containing overall score and breakdown, in input order
+        """
+        try:
+            skills_scores = self._calculate_skills_scores_batch(
+                [resume_data.skills for resume_data in resume_data_list],
+                jd_data.required_skills
+            )
+            experience_scores = self._calculate_experience_scores_batch(
+                np.array([
+                    -1 if resume_data.experience_years is None else resume_data.experience_years
+                    for resume_data in resume_data_list
+                ]),
+                jd_data.required_experience_years
+            )
+            education_scores = np.array([
+                self._calculate_education_score(resume_data.education, jd_data.education_requirements)
+                for resume_data in resume_data_list
+            ])
+            semantic_scores = self._calculate_semantic_scores_batch(
+                [resume_data.full_text for resume_data in resume_data_list],
+                jd_data.full_text
+            )
+            
+            # Calculate weighted overall scores
+            overall_scores = self._weighted(skills_scores, experience_scores, education_scores, semantic_scores)
+            
+            results = []
+            for i in range(len(resume_data_list)):
+                breakdown = MatchScoreBreakdown(
+                    skills_score=round(float(skills_scores[i]) * 100, 2),
+                    experience_score=round(float(experience_scores[i]) * 100, 2),
+                    education_score=round(float(education_scores[i]) * 100, 2),
+                    semantic_score=round(float(semantic_scores[i]) * 100, 2)
+                )
+                results.append({
+                    'overall_score': round(float(overall_scores[i]) * 100, 2),
+                    'breakdown': breakdown
+                })
+            return results
+            
+        except Exception as e:
+            # Return default scores if calculation fails
+            return [
+                {
+                    'overall_score': 0.0,
+                    'breakdown': MatchScoreBreakdown(
+                        skills_score=0.0,
+                        experience_score=0.0,
+                        education_score=0.0,
+                        semantic_score=0.0
+                    ),
+                    'fallback': True
+                }
+                for _ in resume_data_list
+            ]
+    
     def _calculate_skills_score(self, resume_skills: List[str], required_skills: List[str]) -> float:
         """
         Calculate Jaccard similarity score for skills matching
@@ -91,12 +319,14 @@ class MatchingEngine:
             return 0.0
         
         # Convert to lowercase sets for case-insensitive comparison
-        resume_set = set(skill.lower().strip() for skill in resume_skills)
-        required_set = set(skill.lower().strip() for skill in required_skills)
+        resume_set = _normalize_skills(tuple(resume_skills))
+        required_set = _normalize_skills(tuple(required_skills))
         
-        # Calculate Jaccard similarity
-        intersection = len(resume_set.intersection(required_set))
-        union = len(resume_set.union(required_set))
+        # Count the intersection in one pass, union follows by inclusion-exclusion
+        intersection = 0
+        for skill in required_set:
+            intersection += skill in resume_set
+        union = len(resume_set) + len(required_set) - intersection
         
         if union == 0:
             return 0.0
@@ -111,6 +341,52 @@ class MatchingEngine:
         
         return min(final_score, 1.0)
     
+    def _calculate_skills_scores_batch(self, resume_skill_lists: List[List[str]], required_skills: List[str]) -> np.ndarray:
+        """
+        Calculate skills scores for many resumes against one job description
+        
+        Skills are mapped to ids in a vocabulary closed over the batch and each
+        resume becomes a packed bitset, so the intersection with the required
+        skills is one AND plus popcount per resume instead of a Python set loop.
+        
+        Args:
+            resume_skill_lists: Skill lists, one per resume
+            required_skills: List of required skills from job description
+            
+        Returns:
+            Array of skills scores (0.0 to 1.0), one per resume
+        """
+        scores = np.zeros(len(resume_skill_lists))
+        required_set = _normalize_skills(tuple(required_skills))
+        if not resume_skill_lists or not required_set:
+            return scores
+        
+        resume_sets = [_normalize_skills(tuple(skills)) for skills in resume_skill_lists]
+        
+        # Required skills take the first ids, resume-only skills follow
+        vocab = {skill: skill_id for skill_id, skill in enumerate(required_set)}
+        rows, cols = [], []
+        for row, resume_set in enumerate(resume_sets):
+            for skill in resume_set:
+                rows.append(row)
+                cols.append(vocab.setdefault(skill, len(vocab)))
+        
+        membership = np.zeros((len(resume_sets), len(vocab)), dtype=bool)
+        membership[rows, cols] = True
+        resume_bits = np.packbits(membership, axis=1)
+        required_bits = np.packbits(np.arange(len(vocab)) < len(required_set))
+        
+        # AND + popcount per row
+        intersection = np.bitwise_count(resume_bits & required_bits).sum(axis=1)
+        resume_sizes = np.bitwise_count(resume_bits).sum(axis=1)
+        union = resume_sizes + len(required_set) - intersection
+        
+        jaccard_scores = intersection / union
+        overlap_ratios = intersection / len(required_set)
+        scores = (jaccard_scores * 0.3) + (overlap_ratios * 0.7)
+        
+        return np.minimum(scores, 1.0)
+    
     def _calculate_experience_score(self, resume_years: Optional[int], required_years: Optional[int]) -> float:
         """
         Calculate experience score based on years comparison
@@ -131,20 +407,33 @@ class MatchingEngine:
         if resume_years >= required_years:
             return 1.0  # Meets or exceeds requirement
         
-        # Proportional scoring for less experience
-        ratio = resume_years / required_years
+        # Proportional scoring for less experience, bucketed into 20% steps
+        # with integer arithmetic so exact ratios like 3/5 land in the right bucket
+        bucket = (5 * resume_years) // required_years
         
         # Apply a more forgiving curve for close matches
-        if ratio >= 0.8:
-            return 0.9
-        elif ratio >= 0.6:
-            return 0.7
-        elif ratio >= 0.4:
-            return 0.5
-        elif ratio >= 0.2:
-            return 0.3
-        else:
-            return 0.1
+        return float(_EXPERIENCE_LUT[bucket])
+    
+    def _calculate_experience_scores_batch(self, resume_years: np.ndarray, required_years: Optional[int]) -> np.ndarray:
+        """
+        Calculate experience scores for many resumes against one requirement
+        
+        Args:
+            resume_years: Years of experience per resume, -1 where none was found
+            required_years: Required years from job description
+            
+        Returns:
+            Array of experience scores (0.0 to 1.0), one per resume
+        """
+        resume_years = np.asarray(resume_years, dtype=np.int64)
+        if required_years is None:
+            return np.full(resume_years.shape, 0.8)  # Default score when no requirement specified
+        
+        buckets = np.clip((5 * resume_years) // max(required_years, 1), 0, 5)
+        scores = np.where(resume_years >= required_years, 1.0, _EXPERIENCE_LUT[buckets])
+        
+        # No experience information found
+        return np.where(resume_years < 0, 0.0, scores)
     
     def _calculate_education_score(self, resume_education: List[str], required_education: List[str]) -> float:
         """
@@ -166,18 +455,15 @@ class MatchingEngine:
         # Convert to lowercase for comparison
         resume_text = ' '.join(resume_education).lower()
         
-        # Common education keywords
-        education_keywords = {
-            'bachelor': ['bachelor', 'b.s', 'b.a', 'bs', 'ba', 'undergraduate'],
-            'master': ['master', 'm.s', 'm.a', 'ms', 'ma', 'mba', 'graduate'],
-            'phd': ['phd', 'ph.d', 'doctorate', 'doctoral'],
-            'associate': ['associate', 'associates'],
-            'diploma': ['diploma', 'certificate', 'certification'],
-            'degree': ['degree']
+        # Education categories mentioned anywhere in the resume
+        resume_categories = {
+            edu_type for edu_type, pattern in self._edu_patterns.items()
+            if pattern.search(resume_text)
         }
         
         matches = 0
         total_requirements = 0
+        resume_ids = None
         
         for requirement in required_education:
             requirement_lower = requirement.lower()
@@ -185,21 +471,20 @@ class MatchingEngine:
             
             # Check for direct keyword matches
             requirement_matched = False
-            for edu_type, keywords in education_keywords.items():
-                if any(keyword in requirement_lower for keyword in keywords):
-                    if any(keyword in resume_text for keyword in keywords):
-                        matches += 1
-                        requirement_matched = True
-                        break
+            for edu_type in resume_categories:
+                if self._edu_patterns[edu_type].search(requirement_lower):
+                    matches += 1
+                    requirement_matched = True
+                    break
             
             # If no keyword match, check for general text similarity
             if not requirement_matched:
-                requirement_words = set(requirement_lower.split())
-                resume_words = set(resume_text.split())
+                # Tokenize the resume once, only when a requirement needs it
+                if resume_ids is None:
+                    resume_ids = self._tokenize(resume_text)
                 
                 # Calculate word overlap
-                word_overlap = len(requirement_words.intersection(resume_words))
-                overlap_ratio = word_overlap / len(requirement_words) if requirement_words else 0
+                overlap_ratio = _overlap_ratio(self._tokenize(requirement_lower), resume_ids)
                 
                 if overlap_ratio > 0.3:  # At least 30% word overlap
                     matches += 0.5  # Partial match
@@ -210,9 +495,109 @@ class MatchingEngine:
         score = matches / total_requirements
         return min(score, 1.0)
     
+    def _tokenize(self, text: str) -> np.ndarray:
+        """
+        Tokenize text into sorted, unique token ids
+        
+        Tokens come from a single RE2 (or re) scan; ids are non-negative
+        hashes, so no shared vocabulary has to grow or be locked across threads.
+        
+        Args:
+            text: Text to tokenize
+            
+        Returns:
+            Sorted int64 array of unique token ids
+        """
+        return np.unique(np.fromiter(
+            (hash(token) & 0x7fffffffffffffff for token in _TOKEN_RE.findall(text)),
+            dtype=np.int64
+        ))
+    
+    def _split_windows(self, text: str) -> List[str]:
+        """
+        Split text into consecutive windows that each fit the encoder's sequence limit
+        
+        The encoder silently truncates input past max_seq_length tokens (256 for
+        all-MiniLM-L6-v2, about 200 words), which would drop the later sections
+        of most resumes.
+        
+        Args:
+            text: Text to split
+            
+        Returns:
+            List of window texts covering the whole input, in order
+        """
+        window = self._sbert.max_seq_length - 2  # room for [CLS] and [SEP]
+        offsets = self._sbert.tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            verbose=False
+        )['offset_mapping']
+        if len(offsets) <= window:
+            return [text]
+        return [
+            text[offsets[start][0]:offsets[min(start + window, len(offsets)) - 1][1]]
+            for start in range(0, len(offsets), window)
+        ]
+    
+    def _encode(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Encode texts into L2-normalized embeddings, reusing cached vectors
+        
+        Texts missing from the cache are split into windows of at most
+        max_seq_length tokens, all windows are encoded together in a single
+        batch, and each text's normalized window embeddings are mean-pooled.
+        
+        Args:
+            texts: Texts to encode
+            
+        Returns:
+            List of float32 embeddings in the same order as texts
+        """
+        keys = [hashlib.sha1(text.encode()).hexdigest() for text in texts]
+        
+        with self._embedding_lock:
+            embeddings = []
+            for key in keys:
+                embedding = self._embedding_cache.get(key)
+                if embedding is not None:
+                    self._embedding_cache.move_to_end(key)
+                embeddings.append(embedding)
+        
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            windows = []
+            window_starts = []
+            for i in missing:
+                window_starts.append(len(windows))
+                windows.extend(self._split_windows(texts[i]))
+            
+            encoded = self._sbert.encode(
+                windows,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            ).astype(np.float32)
+            
+            # Sum each text's contiguous windows; renormalizing the sum gives the
+            # same direction as the mean, so the dot product stays a cosine
+            pooled = np.add.reduceat(encoded, window_starts, axis=0)
+            norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+            pooled /= np.where(norms > 0, norms, 1.0)
+            
+            with self._embedding_lock:
+                for i, embedding in zip(missing, pooled):
+                    embeddings[i] = embedding
+                    self._embedding_cache[keys[i]] = embedding
+                while len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                    self._embedding_cache.popitem(last=False)
+        
+        return embeddings
+    
     def _calculate_semantic_score(self, resume_text: str, jd_text: str) -> float:
         """
-        Calculate semantic similarity using TF-IDF and cosine similarity
+        Calculate semantic similarity using Sentence-BERT embeddings,
+        or TF-IDF and cosine similarity when the encoder is unavailable
         
         Args:
             resume_text: Full resume text
@@ -225,26 +610,70 @@ class MatchingEngine:
             return 0.0
         
         try:
-            # Create TF-IDF vectorizer
-            vectorizer = TfidfVectorizer(
-                max_features=1000,
-                stop_words='english',
-                ngram_range=(1, 2),
-                min_df=1,
-                max_df=0.9
-            )
-            
-            # Fit and transform texts
-            documents = [resume_text, jd_text]
-            tfidf_matrix = vectorizer.fit_transform(documents)
-            
-            # Calculate cosine similarity
-            similarity_matrix = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
-            similarity_score = similarity_matrix[0][0]
+            if self._sbert is not None:
+                # Embeddings are normalized, so the dot product is the cosine
+                resume_embedding, jd_embedding = self._encode([resume_text, jd_text])
+                similarity_score = float(np.dot(resume_embedding, jd_embedding))
+            else:
+                similarity_score = self._calculate_tfidf_similarity(resume_text, jd_text)
             
             # Ensure score is in valid range
             return max(0.0, min(1.0, similarity_score))
             
         except Exception as e:
             # Return default score if calculation fails
-            return 0.0
\ No newline at end of file
+            return 0.0
+    
+    def _calculate_semantic_scores_batch(self, resume_texts: List[str], jd_text: str) -> np.ndarray:
+        """
+        Calculate semantic similarity for many resumes against one job description
+        
+        With TF-IDF all resumes are transformed into one (N x V) sparse matrix and
+        scored with a single product against the cached JD vector.
+        
+        Args:
+            resume_texts: Full resume texts
+            jd_text: Full job description text
+            
+        Returns:
+            Array of semantic similarity scores (0.0 to 1.0), one per resume
+        """
+        scores = np.zeros(len(resume_texts))
+        if not resume_texts or not jd_text:
+            return scores
+        
+        try:
+            if self._sbert is not None:
+                embeddings = self._encode([jd_text] + resume_texts)
+                scores = np.stack(embeddings[1:]) @ embeddings[0]
+            else:
+                jd_hash = hashlib.sha1(jd_text.encode()).hexdigest()
+                vectorizer, jd_vec = _fit_jd(jd_hash, jd_text)
+                scores = vectorizer.transform(resume_texts) @ jd_vec
+            
+            # Empty resumes score zero; ensure scores are in valid range
+            scores = np.where([bool(text) for text in resume_texts], scores, 0.0)
+            return np.clip(scores, 0.0, 1.0)
+            
+        except Exception as e:
+            # Return default scores if calculation fails
+            return np.zeros(len(resume_texts))
+    
+    def _calculate_tfidf_similarity(self, resume_text: str, jd_text: str) -> float:
+        """
+        Calculate TF-IDF cosine similarity against the cached JD vectorizer
+        
+        Args:
+            resume_text: Full resume text
+            jd_text: Full job description text
+            
+        Returns:
+            Cosine similarity score
+        """
+        # Reuse the vectorizer fitted on this JD, only the resume is transformed
+        jd_hash = hashlib.sha1(jd_text.encode()).hexdigest()
+        vectorizer, jd_vec = _fit_jd(jd_hash, jd_text)
+        resume_vec = vectorizer.transform([resume_text])
+        
+        # Both vectors are L2-normalized, so the dot product is the cosine
+        return float((resume_vec @ jd_vec)[0])
\ No newline at end of file
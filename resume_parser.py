@@ -1,311 +1,657 @@
 import re
 import io
+import asyncio
+import codecs
+import hashlib
+import multiprocessing
+import os
+import string
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from bisect import bisect_left
+from functools import cached_property, lru_cache
 import spacy
-from typing import List, Optional
+from typing import BinaryIO, List, Optional, Set, Tuple, Union
 from fastapi import UploadFile, HTTPException
 import fitz  # PyMuPDF
-from docx import Document
 from models import ResumeData, JobDescriptionData
 
-# Try to import magic with fallback
+# Try to import pyahocorasick for single-pass keyword matching
 try:
-    import magic
-    HAS_MAGIC = True
+    import ahocorasick
+    HAS_AHOCORASICK = True
 except ImportError:
-    HAS_MAGIC = False
+    HAS_AHOCORASICK = False
 
+# Precompiled patterns, so hot paths skip the re module's pattern cache lookup. Everything
+# below _CLEAN_TABLE runs on _preprocess_text output, which is already lowercased, so none
+# of those patterns needs re.IGNORECASE
+_WS_RE = re.compile(r'\s+')
+_CLEAN_RE = re.compile(r'[^\w\s\.\,\(\)\-\+\#]')
 
-class ResumeParser:
-    def __init__(self):
-        self.nlp = None
-        self._initialize_spacy()
+# ASCII translation table doing the lowercasing and _CLEAN_RE substitution in one pass
+_ASCII_KEEP = set(string.ascii_lowercase + string.digits + '_' + '.,()-+#' + ' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f')
+_CLEAN_TABLE = str.maketrans({
+    code: chr(code).lower() if chr(code) in string.ascii_uppercase else ' '
+    for code in range(128) if chr(code) not in _ASCII_KEEP
+})
+
+# Common technical skills, spelled out as literal keywords (variants listed separately)
+_SKILL_KEYWORDS = (
+    'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift', 'kotlin', 'scala',
+    'react', 'angular', 'vue', 'node.js', 'nodejs', 'express', 'django', 'flask', 'spring', 'laravel',
+    'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'terraform',
+    'machine learning', 'artificial intelligence', 'data science', 'deep learning',
+    'agile', 'scrum', 'devops', 'ci/cd', 'microservices', 'rest api', 'graphql',
+    'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind', 'jquery', 'typescript',
+    'linux', 'windows', 'unix', 'macos', 'bash', 'powershell', 'sql', 'nosql',
+)
+
+# Regex fallback over the same keywords; lookarounds instead of \b so c++ and c# match too
+_ALL_SKILLS_RE = re.compile(
+    r'(?<!\w)(?:' + '|'.join(re.escape(keyword) for keyword in sorted(_SKILL_KEYWORDS, key=len, reverse=True)) + r')(?!\w)'
+)
+
+if HAS_AHOCORASICK:
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _SKILL_KEYWORDS:
+        _SKILL_AUTOMATON.add_word(_keyword, _keyword)
+    _SKILL_AUTOMATON.make_automaton()
+
+# Words that mark a NER entity as technology-related when they appear nearby
+_TECH_CONTEXT_KEYWORDS = ('software', 'framework', 'library', 'database', 'cloud', 'api')
+
+# Once patterns find this many skills, the NER pass is skipped
+SKILL_NER_THRESHOLD = 15
+
+# Section bodies match each line possessively: a line only ever ends at a newline or the
+# end of text, so giving characters back can never help and backtracking is ruled out
+_SKILLS_SECTION_RE = re.compile(r'(?:skills?|technical skills?|core competencies):?\s*([^\n]*+(?:\n[^\n]*+)*?)(?:\n\s*\n|\n[a-z]|\Z)')
+_SKILL_SPLIT_RE = re.compile(r'[,;|\n•·\-\*]')
+
+# Any "<n> years" / "<n>+ yrs" mention in a resume, except ones like "5 years ago";
+# the digit lookbehind keeps "2015 years" from reading as 15
+_YEARS_RE = re.compile(r'(?<!\d)(\d{1,2})\+?\s*(?:years?|yrs?)\b(?!\s*ago\b)')
+
+# Required experience years in job descriptions: one alternation with a named group per
+# phrasing, wrapped in a zero-width lookahead so matches of different phrasings may overlap
+_REQ_EXP_RE = re.compile(r'''
+    (?=
+        (?:minimum|at\ least|requires?)\s*(?P<minimum>\d+)\+?\s*years?\s*(?:of\s*)?experience
+      | (?P<required>\d+)\+?\s*years?\s*(?:of\s*)?experience\s*(?:required|needed|preferred)
+      | experience[:\s]*(?P<stated>\d+)\+?\s*years?
+      | (?P<in_field>\d+)\+?\s*years?\s*in\s*(?:the\s*)?(?:field|industry|role)
+      | must\ have\s*(?P<must_have>\d+)\+?\s*years?
+      | (?P<plus>\d+)\+\s*years?
+    )
+''', re.VERBOSE)
+
+_EDU_SECTION_RE = re.compile(r'(?:education|academic background|qualifications):?\s*([^\n]*+(?:\n[^\n]*+)*?)(?:\n\s*\n|\n[a-z]|\Z)')
+
+# Degree patterns within the education section
+_DEGREE_PATTERNS = [re.compile(pattern) for pattern in [
+    r'\b(?:bachelor|master|phd|doctorate|associate|diploma|certificate|b\.?s\.?|m\.?s\.?|m\.?a\.?|b\.?a\.?|m\.?b\.?a\.?|ph\.?d\.?)\b[^.\n]*',
+    r'\b(?:degree|certification|certificate)\s+in\s+[^.\n]*'
+]]
+
+# Education-related text in job descriptions
+_EDU_REQ_PATTERNS = [re.compile(pattern) for pattern in [
+    r'(?:education|qualifications|requirements)[:\s]*([^\n]*+(?:\n[^\n]*+)*?)(?:\n\s*\n|\n[a-z]|\Z)',
+    r'(?:bachelor|master|phd|doctorate|degree|diploma|certificate)[^.\n]*',
+    r'(?:required|preferred)\s*(?:education|qualification)[^.\n]*'
+]]
+
+
+def _is_word_char(char: str) -> bool:
+    """Mirror the regex \\w class for keyword boundary checks"""
+    return char.isalnum() or char == '_'
+
+
+def _match_skill_keywords(text: str) -> Set[str]:
+    """Find skill keywords in lowercased text in a single pass"""
+    if not HAS_AHOCORASICK:
+        return set(_ALL_SKILLS_RE.findall(text))
+    
+    found = set()
+    last = len(text) - 1
+    for end, keyword in _SKILL_AUTOMATON.iter(text):
+        start = end - len(keyword) + 1
+        # Keep whole keywords only, e.g. not "java" inside "javascript"
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last and _is_word_char(text[end + 1]):
+            continue
+        found.add(keyword)
+    return found
+
+
+# WordprocessingML tags read from word/document.xml
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_PARAGRAPH = _W_NS + 'p'
+_W_TEXT = _W_NS + 't'
+_W_TAB = _W_NS + 'tab'
+_W_BREAKS = (_W_NS + 'br', _W_NS + 'cr')
+
+# Bytes read from the start of a file to detect its type
+_SNIFF_SIZE = 2048
+
+# Plain text extraction flags: drops ligature preservation and unknown-glyph CID handling
+# from the defaults; TEXT_INHIBIT_SPACES is left off since it glues adjacent words together
+_PDF_TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+
+def _keyword_spans(text: str, keywords: Tuple[str, ...]) -> Tuple[List[int], List[int]]:
+    """
+    Locate every (possibly overlapping) keyword occurrence in text
+    
+    Args:
+        text: Lowercased text to scan
+        keywords: Keywords to locate
+        
+    Returns:
+        Sorted occurrence start offsets, and for each position the smallest end
+        offset among that occurrence and all later-starting ones
+    """
+    spans = []
+    for keyword in keywords:
+        start = text.find(keyword)
+        while start != -1:
+            spans.append((start, start + len(keyword)))
+            start = text.find(keyword, start + 1)
+    spans.sort()
     
-    def _initialize_spacy(self):
-        """Initialize spaCy model with fallback handling"""
+    starts = [start for start, _ in spans]
+    min_ends = [end for _, end in spans]
+    for i in range(len(min_ends) - 2, -1, -1):
+        min_ends[i] = min(min_ends[i], min_ends[i + 1])
+    return starts, min_ends
+
+
+# Parsed documents kept per parser, keyed by content hash
+PARSE_CACHE_SIZE = 1024
+
+# Bump whenever a change alters parser output (skills, years, education, text cleanup),
+# so screening results persisted from older parser code are not reused
+PARSER_VERSION = 1
+
+# Only NER is used downstream; the rest of the pipeline is excluded so it is never loaded
+SPACY_EXCLUDE = ("tagger", "parser", "attribute_ruler", "lemmatizer", "senter")
+
+
+@lru_cache(maxsize=1)
+def _get_nlp(exclude=SPACY_EXCLUDE):
+    """Load the spaCy model once per process, or None when no model is available"""
+    try:
+        return spacy.load("en_core_web_sm", exclude=list(exclude))
+    except OSError:
+        # Try to download the model if it's not available
         try:
-            import spacy
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # Try to download the model if it's not available
-            try:
-                import spacy
-                import spacy.cli
-                spacy.cli.download("en_core_web_sm")
-                self.nlp = spacy.load("en_core_web_sm")
-            except Exception:
-                # If all fails, create a basic nlp pipeline
-                import spacy
-                self.nlp = spacy.blank("en")
-
-    def parse_resume(self, file: UploadFile) -> ResumeData:
+            from spacy.cli import download
+            download("en_core_web_sm")
+            return spacy.load("en_core_web_sm", exclude=list(exclude))
+        except Exception:
+            # If all fails, run without NLP; a blank pipeline would only tokenize for nothing
+            return None
+
+
+class ResumeParser:
+    def __init__(self):
+        # Parsed results keyed by (kind, extension, content digest), least recently used first
+        self._parse_cache: "OrderedDict[Tuple[str, str, bytes], Union[ResumeData, JobDescriptionData]]" = OrderedDict()
+        self._parse_lock = threading.Lock()
+        # Worker processes for the async parse methods; None keeps parsing on threads
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_workers: Optional[int] = None
+        self._process_pool_lock = threading.Lock()
+
+    @cached_property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use rather than at construction"""
+        return _get_nlp()
+
+    @cached_property
+    def has_ner(self) -> bool:
+        """Whether the pipeline can recognise entities; without it the NER passes are skipped"""
+        return self.nlp is not None and self.nlp.has_pipe("ner")
+
+    def parse_resume(self, file: Union[UploadFile, BinaryIO], filename: Optional[str] = None) -> ResumeData:
         """Parse resume file and extract key information"""
+        source, filename = self._open_source(file, filename)
         try:
-            content = file.file.read()
-            
-            # Determine file type using magic if available, otherwise use extension
-            if HAS_MAGIC and magic:
-                file_type = magic.from_buffer(content, mime=True)
-                is_pdf = 'pdf' in file_type
-                is_word = 'word' in file_type or 'document' in file_type
-                is_text = 'text' in file_type
-            else:
-                # Fallback to extension-based detection
-                filename_lower = (file.filename or "").lower()
-                is_pdf = filename_lower.endswith('.pdf')
-                is_word = filename_lower.endswith('.docx')  # Only support .docx, not .doc
-                is_text = filename_lower.endswith('.txt')
-            
-            # Also check file extension as backup
-            if file.filename:
-                filename_lower = file.filename.lower()
-                if filename_lower.endswith('.pdf'):
-                    is_pdf = True
-                elif filename_lower.endswith('.docx'):
-                    is_word = True
-                elif filename_lower.endswith('.txt'):
-                    is_text = True
-            
-            if is_pdf:
-                text = self._extract_text_from_pdf(content)
-            elif is_word:
-                text = self._extract_text_from_docx(content)
-            elif is_text:
-                text = content.decode('utf-8')
-            else:
-                supported_types = "PDF (.pdf), Word Documents (.docx), or Text files (.txt)"
-                raise HTTPException(status_code=400, detail=f"Unsupported file type. Please upload {supported_types}")
-            
-            cleaned_text = self._preprocess_text(text)
+            cache_key = self._parse_cache_key('resume', source, filename)
+            resume_data = self._parse_cache_get(cache_key)
+            if resume_data is not None:
+                return resume_data
             
-            skills = self._extract_skills(cleaned_text)
-            experience_years = self._extract_experience_years(cleaned_text)
-            education = self._extract_education(cleaned_text)
+            resume_data = self._parse_uncached('resume', source, filename)
+            self._parse_cache_put(cache_key, resume_data)
+            return resume_data
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error parsing resume: {str(e)}")
+
+    def parse_resume_bytes(self, content: bytes, filename: Optional[str] = None) -> ResumeData:
+        """Parse resume file contents and extract key information"""
+        return self.parse_resume(io.BytesIO(content), filename)
+
+    def parse_resumes_bulk(self, files: List[Union[UploadFile, BinaryIO]], filenames: Optional[List[Optional[str]]] = None) -> List[ResumeData]:
+        """
+        Parse many resumes, running spaCy over them as one stream
+        
+        Args:
+            files: Resume uploads or binary file-like objects
+            filenames: Optional filenames, one per file, for file-like objects
             
-            return ResumeData(
-                skills=skills,
-                experience_years=experience_years,
-                education=education,
-                full_text=cleaned_text
-            )
+        Returns:
+            List of ResumeData, in the same order as files
+        """
+        if filenames is None:
+            filenames = [None] * len(files)
+        
+        results: List[Optional[ResumeData]] = [None] * len(files)
+        cache_keys = []
+        cleaned_texts = []
+        for file, filename in zip(files, filenames):
+            source, filename = self._open_source(file, filename)
+            try:
+                cache_key = self._parse_cache_key('resume', source, filename)
+                cached = self._parse_cache_get(cache_key)
+                if cached is not None:
+                    results[len(cache_keys)] = cached
+                    cache_keys.append(None)
+                    continue
+                cleaned_texts.append(self._preprocess_text(self._detect_and_extract(source, filename)))
+                cache_keys.append(cache_key)
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Error parsing resume: {str(e)}")
+        
+        try:
+            # nlp.pipe batches the uncached documents internally instead of one call per resume
+            docs = self.nlp.pipe(cleaned_texts, batch_size=64) if self.has_ner else [None] * len(cleaned_texts)
+            parsed = iter(zip(cleaned_texts, docs))
+            for i, cache_key in enumerate(cache_keys):
+                if cache_key is None:
+                    continue
+                cleaned_text, doc = next(parsed)
+                results[i] = self._build_resume_data(cleaned_text, doc)
+                self._parse_cache_put(cache_key, results[i])
+            return results
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error parsing resume: {str(e)}")
 
-    def parse_job_description(self, file: UploadFile) -> JobDescriptionData:
+    def parse_job_description(self, file: Union[UploadFile, BinaryIO], filename: Optional[str] = None) -> JobDescriptionData:
         """Parse job description from file or text"""
+        if not file:
+            raise HTTPException(status_code=400, detail="Either file or text must be provided")
+        source, filename = self._open_source(file, filename)
         try:
-            if file:
-                # jd_text = text
-                content = file.file.read()
-            # elif file:
-            #     content = file.file.read()
-                
-                # Use same file type detection as resume parsing
-                if HAS_MAGIC and magic:
-                    file_type = magic.from_buffer(content, mime=True)
-                    is_pdf = 'pdf' in file_type
-                    is_word = 'word' in file_type or 'document' in file_type
-                    is_text = 'text' in file_type
-                else:
-                    filename_lower = (file.filename or "").lower()
-                    is_pdf = filename_lower.endswith('.pdf')
-                    is_word = filename_lower.endswith('.docx')
-                    is_text = filename_lower.endswith('.txt')
-                
-                # Also check file extension as backup
-                if file.filename:
-                    filename_lower = file.filename.lower()
-                    if filename_lower.endswith('.pdf'):
-                        is_pdf = True
-                    elif filename_lower.endswith('.docx'):
-                        is_word = True
-                    elif filename_lower.endswith('.txt'):
-                        is_text = True
-                
-                if is_pdf:
-                    jd_text = self._extract_text_from_pdf(content)
-                elif is_word:
-                    jd_text = self._extract_text_from_docx(content)
-                elif is_text:
-                    jd_text = content.decode('utf-8')
-                else:
-                    supported_types = "PDF (.pdf), Word Documents (.docx), or Text files (.txt)"
-                    raise HTTPException(status_code=400, detail=f"Unsupported file type. Please upload {supported_types}")
-            else:
-                raise HTTPException(status_code=400, detail="Either file or text must be provided")
-            
-            cleaned_text = self._preprocess_text(jd_text)
-            
-            required_skills = self._extract_skills(cleaned_text)
-            required_experience_years = self._extract_required_experience_years(cleaned_text)
-            education_requirements = self._extract_education_requirements(cleaned_text)
+            cache_key = self._parse_cache_key('job_description', source, filename)
+            jd_data = self._parse_cache_get(cache_key)
+            if jd_data is not None:
+                return jd_data
             
-            return JobDescriptionData(
-                required_skills=required_skills,
-                required_experience_years=required_experience_years,
-                education_requirements=education_requirements,
-                full_text=cleaned_text
-            )
+            jd_data = self._parse_uncached('job_description', source, filename)
+            self._parse_cache_put(cache_key, jd_data)
+            return jd_data
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error parsing job description: {str(e)}")
 
-    def _extract_text_from_pdf(self, content: bytes) -> str:
+    def parse_job_description_bytes(self, content: bytes, filename: Optional[str] = None) -> JobDescriptionData:
+        """Parse job description file contents and extract key requirements"""
+        return self.parse_job_description(io.BytesIO(content), filename)
+
+    def _parse_uncached(self, kind: str, source: BinaryIO, filename: Optional[str]) -> Union[ResumeData, JobDescriptionData]:
+        """Extract and analyse a resume or job description, bypassing the parse cache"""
+        cleaned_text = self._preprocess_text(self._detect_and_extract(source, filename))
+        
+        if kind == 'resume':
+            # Run the pipeline once and share the doc between extractors
+            doc = self.nlp(cleaned_text) if self.has_ner else None
+            return self._build_resume_data(cleaned_text, doc)
+        
+        return JobDescriptionData(
+            required_skills=self._extract_skills(cleaned_text),
+            required_experience_years=self._extract_required_experience_years(cleaned_text),
+            education_requirements=self._extract_education_requirements(cleaned_text),
+            full_text=cleaned_text
+        )
+
+    def start_process_pool(self, max_workers: Optional[int] = None):
+        """
+        Run the async parse methods in worker processes, so NER is not bound by the GIL
+        
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count)
+        """
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool_workers = max_workers or os.cpu_count()
+                self._process_pool = self._create_process_pool()
+
+    def shutdown_process_pool(self):
+        """Stop the worker processes; the async parse methods fall back to threads"""
+        with self._process_pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _create_process_pool(self) -> ProcessPoolExecutor:
+        """
+        Build the worker pool; spawn, as forking a process that already runs threads is unsafe
+        
+        Spawned workers re-import the launching script, so serve through the uvicorn
+        CLI rather than `python main.py`, or every worker re-runs main.py's module body.
+        (forkserver does not help: its children re-import the script the same way.)
+        """
+        return ProcessPoolExecutor(
+            max_workers=self._process_pool_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _replace_broken_process_pool(self, broken: ProcessPoolExecutor):
+        """Swap in a fresh pool after a worker died, unless another request already did"""
+        with self._process_pool_lock:
+            if self._process_pool is broken:
+                self._process_pool = self._create_process_pool()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    async def parse_resume_async(self, file: UploadFile) -> ResumeData:
+        """Parse a resume upload off the event loop"""
+        if self._process_pool is not None:
+            return await self._parse_in_process_pool('resume', file)
+        await file.seek(0)
+        return await asyncio.to_thread(self.parse_resume, file.file, file.filename)
+
+    async def parse_resumes_bulk_async(self, files: List[UploadFile]) -> List[ResumeData]:
+        """Parse many resume uploads off the event loop"""
+        if self._process_pool is not None:
+            # Spread the resumes over the worker processes instead of one nlp.pipe stream
+            return list(await asyncio.gather(*(self._parse_in_process_pool('resume', file) for file in files)))
+        for file in files:
+            await file.seek(0)
+        return await asyncio.to_thread(
+            self.parse_resumes_bulk,
+            [file.file for file in files],
+            [file.filename for file in files]
+        )
+
+    async def parse_job_description_async(self, file: UploadFile) -> JobDescriptionData:
+        """Parse a job description upload off the event loop"""
+        if self._process_pool is not None:
+            return await self._parse_in_process_pool('job_description', file)
+        await file.seek(0)
+        return await asyncio.to_thread(self.parse_job_description, file.file, file.filename)
+
+    async def _parse_in_process_pool(self, kind: str, file: UploadFile) -> Union[ResumeData, JobDescriptionData]:
+        """Parse an upload in a worker process, consulting this process's parse cache first"""
+        await file.seek(0)
+        content = await file.read()
+        # Hashing the whole upload would block the event loop, so look it up on a thread
+        cache_key, result = await asyncio.to_thread(self._parse_cache_lookup, kind, content, file.filename)
+        if result is not None:
+            return result
+        
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = self._process_pool
+            if pool is None:
+                # The pool was shut down meanwhile; parse on a thread instead
+                return await asyncio.to_thread(self._parse_bytes, kind, content, file.filename)
+            try:
+                result = await loop.run_in_executor(pool, _parse_in_worker, kind, content, file.filename)
+                break
+            except _WorkerParseError as e:
+                raise HTTPException(status_code=e.status_code, detail=e.detail)
+            except BrokenProcessPool:
+                # A worker died (segfault, OOM kill...); rebuild the pool and retry once
+                self._replace_broken_process_pool(pool)
+                if attempt:
+                    raise HTTPException(status_code=500, detail="Error parsing document: parser worker process died")
+        self._parse_cache_put(cache_key, result)
+        return result
+
+    def _parse_bytes(self, kind: str, content: bytes, filename: Optional[str]) -> Union[ResumeData, JobDescriptionData]:
+        """Parse raw bytes as a resume or job description, in this process"""
+        if kind == 'resume':
+            return self.parse_resume_bytes(content, filename)
+        return self.parse_job_description_bytes(content, filename)
+
+    def _detect_and_extract(self, source: BinaryIO, filename: Optional[str]) -> str:
+        """Pick the text extractor by file extension, sniffing the header only when that is unknown"""
+        extension = os.path.splitext(filename or "")[1].lower()
+        handler = self._EXT_HANDLERS.get(extension)
+        
+        if handler is None:
+            handler = self._EXT_HANDLERS.get(self._sniff_extension(source))
+        
+        if handler is None:
+            supported_types = "PDF (.pdf), Word Documents (.docx), or Text files (.txt)"
+            raise HTTPException(status_code=400, detail=f"Unsupported file type. Please upload {supported_types}")
+        return handler(self, source)
+
+    def _build_resume_data(self, cleaned_text: str, doc=None) -> ResumeData:
+        """Run the resume extractors over preprocessed text and its spaCy doc"""
+        return ResumeData(
+            skills=self._extract_skills(cleaned_text, doc),
+            experience_years=self._extract_experience_years(cleaned_text),
+            education=self._extract_education(cleaned_text, doc),
+            full_text=cleaned_text
+        )
+
+    def _parse_cache_key(self, kind: str, source: BinaryIO, filename: Optional[str]) -> Tuple[str, str, bytes]:
+        """Build the parse cache key; the extension is included since it selects the extractor"""
+        digest = hashlib.file_digest(source, lambda: hashlib.blake2b(digest_size=16)).digest()
+        source.seek(0)
+        return kind, os.path.splitext(filename or "")[1].lower(), digest
+
+    def _parse_cache_lookup(self, kind: str, content: bytes, filename: Optional[str]):
+        """Hash raw upload bytes and return (cache key, cached result or None)"""
+        cache_key = self._parse_cache_key(kind, io.BytesIO(content), filename)
+        return cache_key, self._parse_cache_get(cache_key)
+
+    def _parse_cache_get(self, key: Tuple[str, str, bytes]):
+        """Return a cached parse result, or None. Results are shared, so callers must not mutate them"""
+        with self._parse_lock:
+            result = self._parse_cache.get(key)
+            if result is not None:
+                self._parse_cache.move_to_end(key)
+            return result
+
+    def _parse_cache_put(self, key: Tuple[str, str, bytes], result: Union[ResumeData, JobDescriptionData]):
+        """Store a parse result, evicting the least recently used beyond PARSE_CACHE_SIZE"""
+        with self._parse_lock:
+            self._parse_cache[key] = result
+            while len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
+    def _open_source(self, file: Union[UploadFile, BinaryIO], filename: Optional[str]):
+        """Resolve an upload or file-like object into a rewound binary handle and filename"""
+        if isinstance(file, UploadFile):
+            filename = filename or file.filename
+            file = file.file
+        file.seek(0)
+        return file, filename
+
+    def _sniff_extension(self, source: BinaryIO) -> Optional[str]:
+        """Detect the file type from its leading bytes without reading the whole file"""
+        header = source.read(_SNIFF_SIZE)
+        source.seek(0)
+        if header.startswith(b'%PDF'):
+            return '.pdf'
+        if header.startswith(b'PK\x03\x04'):
+            # A zip container; .docx is the only zip-based format accepted
+            return '.docx'
+        if b'\x00' in header:
+            # NUL bytes mark binary content, even when they decode as UTF-8
+            return None
+        try:
+            # Incremental decode tolerates a multi-byte character cut off at the end of the header
+            codecs.getincrementaldecoder('utf-8')().decode(header, final=False)
+        except UnicodeDecodeError:
+            return None
+        return '.txt'
+
+    def _extract_text_from_pdf(self, source: BinaryIO) -> str:
         """Extract text from PDF file"""
-        doc = fitz.open(stream=content, filetype="pdf")
-        text = ""
-        for page in doc:
-            text += page.get_text()  # type: ignore
-        doc.close()
-        return text
-
-    def _extract_text_from_docx(self, content: bytes) -> str:
+        # MuPDF needs the document in one contiguous buffer
+        with fitz.open(stream=source.read(), filetype="pdf") as doc:
+            return "".join(page.get_text("text", flags=_PDF_TEXT_FLAGS) for page in doc)  # type: ignore
+
+    def _extract_text_from_docx(self, source: BinaryIO) -> str:
         """Extract text from DOCX file"""
-        doc = Document(io.BytesIO(content))
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        # Stream word/document.xml straight out of the zip instead of building a python-docx DOM
+        parts = []
+        with zipfile.ZipFile(source) as archive, archive.open('word/document.xml') as document:
+            for _, element in ET.iterparse(document, events=('end',)):
+                tag = element.tag
+                if tag == _W_TEXT:
+                    parts.append(element.text or "")
+                elif tag == _W_TAB:
+                    parts.append("\t")
+                elif tag in _W_BREAKS:
+                    parts.append("\n")
+                elif tag == _W_PARAGRAPH:
+                    parts.append("\n")
+                    element.clear()
+        return "".join(parts)
+
+    def _extract_text_from_txt(self, source: BinaryIO) -> str:
+        """Extract text from plain text file"""
+        return source.read().decode('utf-8')
+
+    # Text extractors keyed by file extension
+    _EXT_HANDLERS = {
+        '.pdf': _extract_text_from_pdf,
+        '.docx': _extract_text_from_docx,  # Only support .docx, not .doc
+        '.txt': _extract_text_from_txt,
+    }
 
     def _preprocess_text(self, text: str) -> str:
         """Clean and preprocess text"""
+        if text.isascii():
+            # Collapse whitespace, then lowercase and drop special characters in one translate pass
+            return _WS_RE.sub(' ', text).translate(_CLEAN_TABLE).strip()
+        
         # Convert to lowercase
         text = text.lower()
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         
         # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s\.\,\(\)\-\+\#]', ' ', text)
+        text = _CLEAN_RE.sub(' ', text)
         
         return text.strip()
 
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, text: str, doc=None) -> List[str]:
         """Extract skills from text using NLP and pattern matching"""
-        doc = self.nlp(text)
-        
-        # Common technical skills patterns
-        skill_patterns = [
-            r'\b(?:python|java|javascript|c\+\+|c#|php|ruby|go|rust|swift|kotlin|scala)\b',
-            r'\b(?:react|angular|vue|node\.?js|express|django|flask|spring|laravel)\b',
-            r'\b(?:mysql|postgresql|mongodb|redis|elasticsearch|cassandra)\b',
-            r'\b(?:aws|azure|gcp|docker|kubernetes|jenkins|git|terraform)\b',
-            r'\b(?:machine learning|artificial intelligence|data science|deep learning)\b',
-            r'\b(?:agile|scrum|devops|ci\/cd|microservices|rest api|graphql)\b',
-            r'\b(?:html|css|sass|less|bootstrap|tailwind|jquery|typescript)\b',
-            r'\b(?:linux|windows|unix|macos|bash|powershell|sql|nosql)\b'
-        ]
-        
         skills = set()
         
-        # Extract using regex patterns
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            skills.update([match.lower().strip() for match in matches])
-        
-        # Extract using spaCy NER for organizations and technologies
-        if self.nlp:
-            doc = self.nlp(text)
-            for ent in doc.ents:
-                if ent.label_ in ['ORG', 'PRODUCT', 'GPE'] and len(ent.text) > 2:
-                    # Filter for technology-related entities
-                    tech_keywords = ['software', 'framework', 'library', 'database', 'cloud', 'api']
-                    context = text[max(0, ent.start_char-50):ent.end_char+50].lower()
-                    if any(keyword in context for keyword in tech_keywords):
-                        skills.add(ent.text.lower().strip())
+        # Extract known skill keywords
+        skills.update(_match_skill_keywords(text))
         
         # Extract skills from skills section
-        skills_section_match = re.search(r'(?:skills?|technical skills?|core competencies):?\s*([^\n]*(?:\n[^\n]*)*?)(?:\n\s*\n|\n[A-Z]|\Z)', text, re.IGNORECASE)
+        skills_section_match = _SKILLS_SECTION_RE.search(text)
         if skills_section_match:
             skills_text = skills_section_match.group(1)
             # Split by common separators
-            skill_items = re.split(r'[,;|\n•·\-\*]', skills_text)
+            skill_items = _SKILL_SPLIT_RE.split(skills_text)
             for item in skill_items:
                 item = item.strip()
                 if len(item) > 2 and len(item) < 30:  # Reasonable skill length
                     skills.add(item.lower())
         
+        # Skip the NER pass when patterns already found enough skills
+        if len(skills) >= SKILL_NER_THRESHOLD:
+            return list(skills)
+        
+        # Extract using spaCy NER for organizations and technologies
+        if doc is None and self.has_ner:
+            doc = self.nlp(text)
+        if doc is not None and doc.ents:
+            keyword_starts, keyword_min_ends = _keyword_spans(text, _TECH_CONTEXT_KEYWORDS)
+            for ent in doc.ents:
+                if ent.label_ in ['ORG', 'PRODUCT', 'GPE'] and len(ent.text) > 2:
+                    # Filter for technology-related entities: a tech keyword must lie within 50 chars
+                    window_start = max(0, ent.start_char - 50)
+                    index = bisect_left(keyword_starts, window_start)
+                    if index < len(keyword_starts) and keyword_min_ends[index] <= ent.end_char + 50:
+                        skills.add(ent.text.lower().strip())
+        
         return list(skills)
 
     def _extract_experience_years(self, text: str) -> Optional[int]:
         """Extract years of experience from resume"""
-        # Pattern to match experience years
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'experience[:\s]*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*in\s*(?:the\s*)?field',
-            r'over\s*(\d+)\s*years?',
-            r'more than\s*(\d+)\s*years?',
-            r'(\d+)\+\s*years?'
-        ]
-        
-        years = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            years.extend([int(match) for match in matches if match.isdigit()])
-        
         # Return the maximum years found
-        return max(years) if years else None
+        return max((int(years) for years in _YEARS_RE.findall(text)), default=None)
 
     def _extract_required_experience_years(self, text: str) -> Optional[int]:
         """Extract required years of experience from job description"""
-        patterns = [
-            r'(?:minimum|at least|requires?)\s*(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience\s*(?:required|needed|preferred)',
-            r'experience[:\s]*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*in\s*(?:the\s*)?(?:field|industry|role)',
-            r'must have\s*(\d+)\+?\s*years?',
-            r'(\d+)\+\s*years?'
-        ]
-        
-        years = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            years.extend([int(match) for match in matches if match.isdigit()])
+        # Exactly one named group takes part in each match
+        years = [int(match[match.lastgroup]) for match in _REQ_EXP_RE.finditer(text)]
         
         return max(years) if years else None
 
-    def _extract_education(self, text: str) -> List[str]:
+    def _extract_education(self, text: str, doc=None) -> List[str]:
         """Extract education information from resume"""
-        education = []
+        education = set()
         
         # Extract education section
-        education_section_match = re.search(r'(?:education|academic background|qualifications):?\s*([^\n]*(?:\n[^\n]*)*?)(?:\n\s*\n|\n[A-Z]|\Z)', text, re.IGNORECASE)
+        education_section_match = _EDU_SECTION_RE.search(text)
         if education_section_match:
             education_text = education_section_match.group(1)
             
             # Extract degree patterns
-            degree_patterns = [
-                r'\b(?:bachelor|master|phd|doctorate|associate|diploma|certificate|b\.?s\.?|m\.?s\.?|m\.?a\.?|b\.?a\.?|m\.?b\.?a\.?|ph\.?d\.?)\b[^.\n]*',
-                r'\b(?:degree|certification|certificate)\s+in\s+[^.\n]*'
-            ]
-            
-            for pattern in degree_patterns:
-                matches = re.findall(pattern, education_text, re.IGNORECASE)
-                education.extend([match.strip() for match in matches])
+            for pattern in _DEGREE_PATTERNS:
+                matches = pattern.findall(education_text)
+                education.update(match.strip() for match in matches)
         
         # Use spaCy to extract educational institutions
-        if self.nlp:
+        if doc is None and self.has_ner:
             doc = self.nlp(text)
+        if doc is not None:
             for ent in doc.ents:
                 if ent.label_ in ['ORG'] and any(keyword in ent.text.lower() for keyword in ['university', 'college', 'institute', 'school']):
-                    education.append(ent.text.strip())
+                    education.add(ent.text.strip())
         
-        return list(set(education))
+        return list(education)
 
     def _extract_education_requirements(self, text: str) -> List[str]:
         """Extract education requirements from job description"""
-        education_requirements = []
+        education_requirements = set()
         
         # Extract education-related text
-        education_patterns = [
-            r'(?:education|qualifications|requirements)[:\s]*([^\n]*(?:\n[^\n]*)*?)(?:\n\s*\n|\n[A-Z]|\Z)',
-            r'(?:bachelor|master|phd|doctorate|degree|diploma|certificate)[^.\n]*',
-            r'(?:required|preferred)\s*(?:education|qualification)[^.\n]*'
-        ]
-        
-        for pattern in education_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _EDU_REQ_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, str) and len(match.strip()) > 0:
-                    education_requirements.append(match.strip())
+                    education_requirements.add(match.strip())
         
-        return list(set(education_requirements))
\ No newline at end of file
+        return list(education_requirements)
+
+
+class _WorkerParseError(Exception):
+    """Picklable stand-in for an HTTPException raised inside a worker process"""
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+# Parser owned by a worker process, created on its first task and reused after
+_worker_parser: Optional[ResumeParser] = None
+
+
+def _parse_in_worker(kind: str, content: bytes, filename: Optional[str]) -> Union[ResumeData, JobDescriptionData]:
+    """Process pool entry point: parse a resume or job description from raw bytes"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ResumeParser()
+    # The parent process caches results, so the worker parses uncached
+    try:
+        return _worker_parser._parse_uncached(kind, io.BytesIO(content), filename)
+    except Exception as e:
+        raise _WorkerParseError(500, f"Error parsing {kind.replace('_', ' ')}: {str(e)}")
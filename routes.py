@@ -0,0 +1,195 @@
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
+from typing import BinaryIO, List
+import asyncio
+import functools
+import hashlib
+import operator
+from diskcache import Cache
+
+from models import ScreeningResponse
+from resume_parser import ResumeParser, PARSER_VERSION
+from matching_engine import MatchingEngine, SCORING_VERSION
+
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Persistent cache of screening results keyed by (resume hash, JD hash)
+SCREENING_CACHE_DIR = "/tmp/screening_cache"
+SCREENING_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+screening_cache = Cache(SCREENING_CACHE_DIR)
+
+
+def get_resume_parser(request: Request) -> ResumeParser:
+    """Dependency injection for resume parser, shared app-wide via app.state"""
+    return request.app.state.resume_parser
+
+def get_matching_engine(request: Request) -> MatchingEngine:
+    """Dependency injection for matching engine, shared app-wide via app.state"""
+    return request.app.state.matching_engine
+
+
+def get_content_hash(file: BinaryIO) -> str:
+    """SHA-256 hex digest of a seekable file, streamed instead of read into memory"""
+    file.seek(0)
+    digest = hashlib.file_digest(file, 'sha256').hexdigest()
+    file.seek(0)
+    return digest
+
+
+def get_match_message(overall_score: float) -> str:
+    """Describe an overall match percentage for the response message"""
+    if overall_score >= 80:
+        return "Excellent match! This candidate meets most of the job requirements."
+    elif overall_score >= 60:
+        return "Good match! This candidate has several relevant qualifications."
+    elif overall_score >= 40:
+        return "Fair match! This candidate has some relevant experience but may need additional training."
+    elif overall_score >= 20:
+        return "Limited match! This candidate has minimal relevant qualifications."
+    else:
+        return "Poor match! This candidate does not meet most of the job requirements."
+
+
+@router.get("/")
+async def root():
+    """Root endpoint with API information"""
+    return {
+        "message": "Resume Screening API",
+        "version": "1.0.0",
+        "endpoints": {
+            "screen_resume": "/screen_resume",
+            "screen_resumes_batch": "/screen_resumes_batch",
+            "health": "/health"
+        }
+    }
+
+@router.get("/health")
+async def health_check():
+    """Health check endpoint"""
+    return {"status": "healthy", "service": "Resume Screening API"}
+
+@router.post("/screen_resume", response_model=ScreeningResponse)
+async def screen_resume(
+    resume_file: UploadFile = File(..., description="Resume file (PDF, DOCX, or TXT)"),
+    jd_file: UploadFile = File(..., description="Job description file (PDF, DOCX, or TXT)"),
+    # jd_text: Optional[str] = Form(None, description="Job description as text"),
+    parser: ResumeParser = Depends(get_resume_parser),
+    engine: MatchingEngine = Depends(get_matching_engine)
+):
+    """
+    Screen a resume against a job description and return match scores
+    
+    Args:
+        resume_file: Resume file upload (required)
+        jd_file: Job description file upload (optional if jd_text provided)
+        jd_text: Job description as text (optional if jd_file provided)
+        
+    Returns:
+        ScreeningResponse with overall match percentage and detailed breakdown
+    """
+    try:
+        # Validate inputs
+        if not jd_file:
+        # and not jd_text:
+            raise HTTPException(
+                status_code=400, 
+                detail="jd_file must be provided"
+            )
+        
+        # Run the CPU-bound work on the thread pool
+        loop = asyncio.get_running_loop()
+        
+        # Return the cached result if this resume/JD pair was already screened
+        resume_hash, jd_hash = await asyncio.gather(
+            loop.run_in_executor(None, get_content_hash, resume_file.file),
+            loop.run_in_executor(None, get_content_hash, jd_file.file)
+        )
+        # Scores depend on the parser and scoring code and on which NER/semantic models are active,
+        # not just the inputs. The first has_ner check loads spaCy, so it runs on the thread pool
+        has_ner = await loop.run_in_executor(None, operator.attrgetter('has_ner'), parser)
+        cache_key = (SCORING_VERSION, PARSER_VERSION, engine.scorer_name, has_ner, resume_hash, jd_hash)
+        # diskcache does SQLite I/O and unpickling, so keep it off the event loop
+        cached_response = await loop.run_in_executor(None, screening_cache.get, cache_key)
+        if cached_response is not None:
+            return ScreeningResponse(**cached_response)
+        
+        # Parse resume and job description concurrently, streaming from the spooled upload files
+        resume_data, jd_data = await asyncio.gather(
+            parser.parse_resume_async(resume_file),
+            parser.parse_job_description_async(jd_file)
+        )
+        
+        # Calculate match scores
+        match_result = await loop.run_in_executor(None, engine.calculate_match_score, resume_data, jd_data)
+        
+        # Determine message based on score
+        overall_score = match_result['overall_score']
+        response = ScreeningResponse(
+            overall_match_percentage=overall_score,
+            breakdown=match_result['breakdown'],
+            message=get_match_message(overall_score)
+        )
+        # A failed calculation yields placeholder zeros, which must not be served for the whole TTL
+        if not match_result.get('fallback'):
+            await loop.run_in_executor(
+                None,
+                functools.partial(screening_cache.set, cache_key, response.model_dump(), expire=SCREENING_CACHE_TTL)
+            )
+        
+        return response
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"An error occurred while processing the request: {str(e)}"
+        )
+
+@router.post("/screen_resumes_batch", response_model=List[ScreeningResponse])
+async def screen_resumes_batch(
+    resume_files: List[UploadFile] = File(..., description="Resume files (PDF, DOCX, or TXT)"),
+    jd_file: UploadFile = File(..., description="Job description file (PDF, DOCX, or TXT)"),
+    parser: ResumeParser = Depends(get_resume_parser),
+    engine: MatchingEngine = Depends(get_matching_engine)
+):
+    """
+    Screen many resumes against one job description and return match scores
+    
+    Args:
+        resume_files: Resume file uploads (required)
+        jd_file: Job description file upload (required)
+        
+    Returns:
+        List of ScreeningResponse, in the same order as resume_files
+    """
+    try:
+        # Run the CPU-bound work on the thread pool
+        loop = asyncio.get_running_loop()
+        
+        # Parse the job description alongside the resumes, which go through spaCy as one stream
+        jd_data, resume_data_list = await asyncio.gather(
+            parser.parse_job_description_async(jd_file),
+            parser.parse_resumes_bulk_async(resume_files)
+        )
+        
+        # Score the whole batch against the JD at once
+        match_results = await loop.run_in_executor(None, engine.calculate_match_scores_batch, resume_data_list, jd_data)
+        
+        return [
+            ScreeningResponse(
+                overall_match_percentage=match_result['overall_score'],
+                breakdown=match_result['breakdown'],
+                message=get_match_message(match_result['overall_score'])
+            )
+            for match_result in match_results
+        ]
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, 
+            detail=f"An error occurred while processing the request: {str(e)}"
+        )